@@ -8,26 +8,26 @@ License: MIT
 Repository: https://github.com/yourusername/video-downloader
 """
 
+import contextlib
 import os
 import sys
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
 try:
     import yt_dlp
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.panel import Panel
     from rich.prompt import Prompt, Confirm
     from rich.table import Table
     from rich import box
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TransferSpeedColumn
-    from rich.tree import Tree
     from rich.align import Align
-    from rich.layout import Layout
-    from rich.live import Live
     from rich.text import Text
+    from rich.style import Style
 except ImportError:
     print("⚠️  Missing required libraries. Please install them:")
     print("pip install -r requirements.txt")
@@ -36,6 +36,84 @@ except ImportError:
 
 console = Console()
 
+# Bytes to mebibytes multiplier
+_MB = 1.0 / (1024 * 1024)
+
+# Parallel HLS/DASH fragment connections, capped to stay polite with one CDN
+_MAX_FRAGMENT_WORKERS = min(os.cpu_count() or 4, 8)
+
+# Maximum number of downloads kept in the session history
+_HISTORY_LIMIT = 1000
+
+# Pre-parsed styles reused by Text.append instead of parsing strings each time
+_S_BOLD_CYAN = Style.parse("bold cyan")
+_S_BOLD_GREEN = Style.parse("bold green")
+_S_BOLD_YELLOW = Style.parse("bold yellow")
+_S_BOLD_WHITE = Style.parse("bold white")
+_S_BANNER_TITLE = Style.parse("bold yellow blink")
+_S_CYAN = Style.parse("cyan")
+_S_YELLOW = Style.parse("yellow")
+_S_WHITE = Style.parse("white")
+
+# Welcome banner is static, so it is assembled once at import time
+_BANNER_TEXT = Text()
+_BANNER_TEXT.append("\n")
+_BANNER_TEXT.append("╔═══════════════════════════════════════════════════════════════╗\n", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("║                                                               ║\n", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("║           ", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("🎥  SOCIAL MEDIA VIDEO DOWNLOADER  🎥", style=_S_BANNER_TITLE)
+_BANNER_TEXT.append("           ║\n", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("║                                                               ║\n", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("║              ", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("Download videos from 5+ platforms", style=_S_BOLD_WHITE)
+_BANNER_TEXT.append("               ║\n", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("║                    ", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("Fast • Reliable • Easy", style=_S_BOLD_GREEN)
+_BANNER_TEXT.append("                    ║\n", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("║                                                               ║\n", style=_S_BOLD_CYAN)
+_BANNER_TEXT.append("╚═══════════════════════════════════════════════════════════════╝\n", style=_S_BOLD_CYAN)
+_BANNER = Align.center(_BANNER_TEXT)
+
+# Static parts of the result panels, parsed from markup once
+_ERROR_HEADER = Text.from_markup(
+    "[bold red]❌ Download Failed[/bold red]\n\n"
+    "[yellow]Error Details:[/yellow]\n"
+)
+_ERROR_TIPS = Text.from_markup(
+    "\n\n[cyan]🔧 Troubleshooting Tips:[/cyan]\n"
+    "[white]• Verify the URL is correct and complete\n"
+    "• Check if the video is public and accessible\n"
+    "• Ensure you have stable internet connection\n"
+    "• Try updating yt-dlp: pip install -U yt-dlp\n"
+    "• Some platforms may require authentication[/white]"
+)
+_GOODBYE = Group(
+    Text(),
+    Panel(
+        Text.from_markup(
+            "[bold yellow]👋 Thank you for using Video Downloader!\n"
+            "⭐ If you like it, star us on GitHub![/bold yellow]"
+        ),
+        border_style="yellow",
+        box=box.DOUBLE
+    ),
+    Text()
+)
+
+
+def _truncate_title(title: str) -> str:
+    """Shorten long titles to fit the statistics table"""
+    return title if len(title) <= 50 else title[:47] + "..."
+
+
+def _is_expired_url_error(error: Exception) -> bool:
+    """Tell whether a yt-dlp error means the extracted media URLs went stale"""
+    if isinstance(error, yt_dlp.utils.ReExtractInfo):
+        return True
+    exc_info = getattr(error, 'exc_info', None)
+    cause = exc_info[1] if exc_info else None
+    return getattr(cause, 'status', None) in (403, 410)
+
 
 @dataclass
 class PlatformConfig:
@@ -103,109 +181,116 @@ class Platform:
         ]
     )
     
+    # Flat (domain, platform) pairs scanned in order by detect_platform
+    _DOMAIN_INDEX = tuple(
+        (domain, config)
+        for config in (YOUTUBE, INSTAGRAM, FACEBOOK, TWITTER, PINTEREST)
+        for domain in config.domains
+    )
+    
     @classmethod
     def get_all(cls) -> Dict[str, PlatformConfig]:
         """Get all platform configurations"""
-        return {
-            '1': cls.YOUTUBE,
-            '2': cls.INSTAGRAM,
-            '3': cls.FACEBOOK,
-            '4': cls.TWITTER,
-            '5': cls.PINTEREST
-        }
+        return _ALL_PLATFORMS
     
     @classmethod
     def detect_platform(cls, url: str) -> Optional[PlatformConfig]:
         """Auto-detect platform from URL"""
-        for platform in cls.get_all().values():
-            if any(domain in url.lower() for domain in platform.domains):
+        url_lower = url.lower()
+        for domain, platform in cls._DOMAIN_INDEX:
+            if url_lower.find(domain) != -1:
                 return platform
         return None
 
 
+# Menu options mapped to platforms, built once at import time
+_ALL_PLATFORMS: Dict[str, PlatformConfig] = {
+    '1': Platform.YOUTUBE,
+    '2': Platform.INSTAGRAM,
+    '3': Platform.FACEBOOK,
+    '4': Platform.TWITTER,
+    '5': Platform.PINTEREST
+}
+
+
 class UIManager:
     """Manages all UI elements and displays"""
     
     def __init__(self, console: Console):
         self.console = console
+        # Per-session renderables are built on first use and reused afterwards
+        self._platforms_menu: Optional[Group] = None
+        self._platforms_menu_source: Optional[Dict[str, PlatformConfig]] = None
+        self._platform_guides: Dict[str, Group] = {}
     
     def show_banner(self):
         """Display animated welcome banner"""
-        banner_text = Text()
-        banner_text.append("\n")
-        banner_text.append("╔═══════════════════════════════════════════════════════════════╗\n", style="bold cyan")
-        banner_text.append("║                                                               ║\n", style="bold cyan")
-        banner_text.append("║           ", style="bold cyan")
-        banner_text.append("🎥  SOCIAL MEDIA VIDEO DOWNLOADER  🎥", style="bold yellow blink")
-        banner_text.append("           ║\n", style="bold cyan")
-        banner_text.append("║                                                               ║\n", style="bold cyan")
-        banner_text.append("║              ", style="bold cyan")
-        banner_text.append("Download videos from 5+ platforms", style="bold white")
-        banner_text.append("               ║\n", style="bold cyan")
-        banner_text.append("║                    ", style="bold cyan")
-        banner_text.append("Fast • Reliable • Easy", style="bold green")
-        banner_text.append("                    ║\n", style="bold cyan")
-        banner_text.append("║                                                               ║\n", style="bold cyan")
-        banner_text.append("╚═══════════════════════════════════════════════════════════════╝\n", style="bold cyan")
-        
-        self.console.print(Align.center(banner_text))
+        self.console.print(_BANNER)
     
     def show_platforms_menu(self, platforms: Dict[str, PlatformConfig]):
         """Display beautiful platforms menu"""
-        table = Table(
-            title="[bold yellow]📱 Supported Platforms[/bold yellow]",
-            box=box.HEAVY,
-            show_header=True,
-            header_style="bold magenta",
-            border_style="cyan",
-            title_style="bold yellow"
-        )
-        
-        table.add_column("Option", style="bold cyan", justify="center", width=10)
-        table.add_column("Platform", style="bold green", width=20)
-        table.add_column("Icon", justify="center", width=8)
-        table.add_column("Status", style="bold", width=15)
-        
-        for key, platform in platforms.items():
-            table.add_row(
-                key,
-                platform.name,
-                platform.icon,
-                "[green]✓ Active[/green]"
+        if self._platforms_menu is None or self._platforms_menu_source is not platforms:
+            table = Table(
+                title="[bold yellow]📱 Supported Platforms[/bold yellow]",
+                box=box.HEAVY,
+                show_header=True,
+                header_style="bold magenta",
+                border_style="cyan",
+                title_style="bold yellow"
             )
+            
+            table.add_column("Option", style="bold cyan", justify="center", width=10)
+            table.add_column("Platform", style="bold green", width=20)
+            table.add_column("Icon", justify="center", width=8)
+            table.add_column("Status", style="bold", width=15)
+            
+            for key, platform in platforms.items():
+                table.add_row(
+                    key,
+                    platform.name,
+                    platform.icon,
+                    "[green]✓ Active[/green]"
+                )
+            
+            table.add_row("", "", "", "", style="dim")
+            table.add_row("0", "Exit Program", "🚪", "[red]Exit[/red]", style="bold red")
+            
+            self._platforms_menu = Group(Text(), Align.center(table), Text())
+            self._platforms_menu_source = platforms
         
-        table.add_row("", "", "", "", style="dim")
-        table.add_row("0", "Exit Program", "🚪", "[red]Exit[/red]", style="bold red")
-        
-        self.console.print()
-        self.console.print(Align.center(table))
+        self.console.print(self._platforms_menu)
     
     def show_platform_guide(self, platform: PlatformConfig):
         """Show detailed guide for selected platform"""
-        tree = Tree(
-            f"[bold cyan]{platform.icon} {platform.name} - URL Examples[/bold cyan]",
-            guide_style="bold cyan"
-        )
-        
-        for i, example in enumerate(platform.examples, 1):
-            branch = tree.add(f"[yellow]Example {i}[/yellow]")
-            branch.add(f"[white]{example}[/white]")
-        
-        tips = tree.add("[bold green]💡 Tips[/bold green]")
-        tips.add("[white]• Copy URL directly from your browser[/white]")
-        tips.add("[white]• Make sure the video is public[/white]")
-        tips.add("[white]• Video will be saved in highest quality[/white]")
-        
-        panel = Panel(
-            tree,
-            title=f"[bold green]How to Download from {platform.name}[/bold green]",
-            border_style="green",
-            box=box.DOUBLE,
-            padding=(1, 2)
-        )
+        guide = self._platform_guides.get(platform.name)
+        if guide is None:
+            from rich.tree import Tree
+            
+            tree = Tree(
+                f"[bold cyan]{platform.icon} {platform.name} - URL Examples[/bold cyan]",
+                guide_style="bold cyan"
+            )
+            
+            for i, example in enumerate(platform.examples, 1):
+                branch = tree.add(f"[yellow]Example {i}[/yellow]")
+                branch.add(f"[white]{example}[/white]")
+            
+            tips = tree.add("[bold green]💡 Tips[/bold green]")
+            tips.add("[white]• Copy URL directly from your browser[/white]")
+            tips.add("[white]• Make sure the video is public[/white]")
+            tips.add("[white]• Video will be saved in highest quality[/white]")
+            
+            panel = Panel(
+                tree,
+                title=f"[bold green]How to Download from {platform.name}[/bold green]",
+                border_style="green",
+                box=box.DOUBLE,
+                padding=(1, 2)
+            )
+            guide = Group(Text(), panel, Text())
+            self._platform_guides[platform.name] = guide
         
-        self.console.print()
-        self.console.print(panel)
+        self.console.print(guide)
     
     def show_video_info(self, info: dict):
         """Display video information in a beautiful table"""
@@ -221,41 +306,43 @@ class UIManager:
         table.add_column("Value", style="white", width=60)
         
         # Format duration
-        duration = info.get('duration', 0)
-        minutes, seconds = divmod(int(duration), 60)
-        duration_str = f"{minutes}m {seconds}s" if duration else "N/A"
+        duration = int(info.get('duration') or 0)
+        duration_str = f"{duration // 60}m {duration % 60}s" if duration else "N/A"
         
         # Format views
-        views = info.get('view_count', 'N/A')
+        views = info.get('view_count')
         if isinstance(views, int):
-            views = f"{views:,}"
+            views_str = f"{views:,}"
+        else:
+            views_str = "N/A" if views is None else str(views)
         
         # Format file size
-        filesize = info.get('filesize', info.get('filesize_approx', 'N/A'))
-        if isinstance(filesize, int):
-            filesize_mb = filesize / (1024 * 1024)
-            filesize = f"{filesize_mb:.2f} MB"
+        filesize = info.get('filesize') or info.get('filesize_approx')
+        filesize_str = f"{filesize * _MB:.2f} MB" if filesize else "N/A"
         
-        table.add_row("📝 Title", info.get('title', 'N/A'))
-        table.add_row("👤 Uploader", info.get('uploader', 'N/A'))
-        table.add_row("⏱️  Duration", duration_str)
-        table.add_row("👁️  Views", str(views))
-        table.add_row("💾 File Size", str(filesize))
-        table.add_row("📅 Upload Date", info.get('upload_date', 'N/A'))
+        rows = (
+            ("📝 Title", info.get('title', 'N/A')),
+            ("👤 Uploader", info.get('uploader', 'N/A')),
+            ("⏱️  Duration", duration_str),
+            ("👁️  Views", views_str),
+            ("💾 File Size", filesize_str),
+            ("📅 Upload Date", info.get('upload_date', 'N/A')),
+        )
+        for row in rows:
+            table.add_row(*row)
         
-        self.console.print()
-        self.console.print(Align.center(table))
+        self.console.print(Group(Text(), Align.center(table), Text()))
     
-    def show_success_message(self, output_path: Path, filename: str):
+    def show_success_message(self, file_path: str):
         """Display success message with file info"""
         success_text = Text()
-        success_text.append("✅ ", style="bold green")
-        success_text.append("Download Completed Successfully!\n\n", style="bold green")
-        success_text.append("📁 ", style="cyan")
-        success_text.append("File Location:\n", style="bold cyan")
-        success_text.append(f"   {output_path / filename}\n\n", style="white")
-        success_text.append("🎉 ", style="yellow")
-        success_text.append("Ready to watch!", style="bold yellow")
+        success_text.append("✅ ", style=_S_BOLD_GREEN)
+        success_text.append("Download Completed Successfully!\n\n", style=_S_BOLD_GREEN)
+        success_text.append("📁 ", style=_S_CYAN)
+        success_text.append("File Location:\n", style=_S_BOLD_CYAN)
+        success_text.append(f"   {file_path}\n\n", style=_S_WHITE)
+        success_text.append("🎉 ", style=_S_YELLOW)
+        success_text.append("Ready to watch!", style=_S_BOLD_YELLOW)
         
         panel = Panel(
             Align.center(success_text),
@@ -264,61 +351,97 @@ class UIManager:
             padding=(1, 2)
         )
         
-        self.console.print()
-        self.console.print(panel)
+        self.console.print(Group(Text(), panel))
     
     def show_error_message(self, error: str):
         """Display error message with troubleshooting tips"""
         error_panel = Panel(
-            f"[bold red]❌ Download Failed[/bold red]\n\n"
-            f"[yellow]Error Details:[/yellow]\n{error}\n\n"
-            f"[cyan]🔧 Troubleshooting Tips:[/cyan]\n"
-            f"[white]• Verify the URL is correct and complete\n"
-            f"• Check if the video is public and accessible\n"
-            f"• Ensure you have stable internet connection\n"
-            f"• Try updating yt-dlp: pip install -U yt-dlp\n"
-            f"• Some platforms may require authentication[/white]",
+            Text.assemble(_ERROR_HEADER, error, _ERROR_TIPS),
             border_style="red",
             box=box.HEAVY,
             padding=(1, 2)
         )
         
-        self.console.print()
-        self.console.print(error_panel)
+        self.console.print(Group(Text(), error_panel))
+    
+    def show_goodbye_message(self):
+        """Display farewell panel when leaving the program"""
+        self.console.print(_GOODBYE)
 
 
 class DownloadProgressHook:
     """Custom progress hook for yt-dlp"""
     
+    # Callbacks between plain-text progress lines when not attached to a terminal
+    PLAIN_PROGRESS_INTERVAL = 100
+    
     def __init__(self, console: Console):
         self.console = console
         self.progress = None
         self.task = None
+        self.callbacks = 0
+        # isatty() is a syscall, check it once rather than on every callback
+        self.live = console.is_terminal
+        # Fragment worker threads may report progress concurrently
+        self._lock = threading.Lock()
     
     def __call__(self, d):
+        if not self.live:
+            self._report_plain(d)
+            return
+        
         if d['status'] == 'downloading':
-            if self.progress is None:
-                self.progress = Progress(
-                    SpinnerColumn(),
-                    TextColumn("[bold cyan]{task.description}"),
-                    BarColumn(bar_width=40),
-                    DownloadColumn(),
-                    TransferSpeedColumn(),
-                    console=self.console
-                )
-                self.progress.start()
-                self.task = self.progress.add_task(
-                    "Downloading...",
-                    total=d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-                )
-            
-            downloaded = d.get('downloaded_bytes', 0)
-            self.progress.update(self.task, completed=downloaded)
+            with self._lock:
+                if self.task is None:
+                    if self.progress is None:
+                        from rich.progress import (
+                            Progress, SpinnerColumn, TextColumn, BarColumn,
+                            DownloadColumn, TransferSpeedColumn
+                        )
+                        
+                        self.progress = Progress(
+                            SpinnerColumn(),
+                            TextColumn("[bold cyan]{task.description}"),
+                            BarColumn(bar_width=40),
+                            DownloadColumn(),
+                            TransferSpeedColumn(),
+                            console=self.console
+                        )
+                    self.progress.start()
+                    # Unknown size gives an indeterminate bar instead of an empty one
+                    self.task = self.progress.add_task(
+                        "Downloading...",
+                        total=d.get('total_bytes') or d.get('total_bytes_estimate') or None
+                    )
+                
+                # Updated under the lock so reset() cannot remove the task mid-update
+                downloaded = d.get('downloaded_bytes', 0)
+                self.progress.update(self.task, completed=downloaded)
         
         elif d['status'] == 'finished':
-            if self.progress:
+            self.reset()
+    
+    def reset(self):
+        """Stop the live display and drop the current task, if any"""
+        with self._lock:
+            self.callbacks = 0
+            if self.task is not None:
                 self.progress.stop()
-                self.progress = None
+                self.progress.remove_task(self.task)
+                self.task = None
+    
+    def _report_plain(self, d):
+        """Print occasional progress lines instead of a live progress bar"""
+        if d['status'] == 'downloading':
+            self.callbacks += 1
+            if self.callbacks % self.PLAIN_PROGRESS_INTERVAL == 1:
+                downloaded = d.get('downloaded_bytes') or 0
+                self.console.print(f"Downloaded {downloaded * _MB:.2f} MB", highlight=False)
+        
+        elif d['status'] == 'finished':
+            self.callbacks = 0
+            downloaded = d.get('downloaded_bytes') or d.get('total_bytes') or 0
+            self.console.print(f"Downloaded {downloaded * _MB:.2f} MB", highlight=False)
 
 
 class VideoDownloader:
@@ -329,59 +452,89 @@ class VideoDownloader:
         self.output_dir.mkdir(exist_ok=True)
         self.ui = UIManager(console)
         self.platforms = Platform.get_all()
-        self.download_history: List[str] = []
-    
-    def configure_ydl_options(self, platform: PlatformConfig) -> dict:
-        """Configure yt-dlp options based on platform"""
-        progress_hook = DownloadProgressHook(console)
+        self.download_history: Deque[str] = deque(maxlen=_HISTORY_LIMIT)
+        self.download_count = 0
+        self.progress_hook = DownloadProgressHook(console)
         
-        options = {
+        # Platform independent yt-dlp options, merged with the format per download
+        self._ydl_opts_base = self._create_base_ydl_options()
+    
+    @staticmethod
+    def _create_stats_table() -> Table:
+        """Create an empty download statistics table"""
+        stats_table = Table(
+            title="[bold cyan]📊 Download Statistics[/bold cyan]",
+            box=box.ROUNDED,
+            border_style="cyan"
+        )
+        stats_table.add_column("#", style="cyan", width=5)
+        stats_table.add_column("Video Title", style="white", width=50)
+        return stats_table
+    
+    def _create_base_ydl_options(self) -> dict:
+        """Build the yt-dlp options shared by every download"""
+        return {
             'outtmpl': str(self.output_dir / '%(title)s.%(ext)s'),
-            'format': platform.format_preference,
             'quiet': True,
             'no_warnings': True,
-            'progress_hooks': [progress_hook],
+            'progress_hooks': [self.progress_hook],
             'nocheckcertificate': True,
             'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'concurrent_fragment_downloads': _MAX_FRAGMENT_WORKERS,
+            'http_chunk_size': 10 * 1024 * 1024,
+            'buffersize': 1024 * 1024,
+            'socket_timeout': 30,
         }
-        
-        return options
+    
+    def configure_ydl_options(self, platform: PlatformConfig) -> dict:
+        """Configure yt-dlp options based on platform"""
+        return {**self._ydl_opts_base, 'format': platform.format_preference}
     
     def download_video(self, url: str, platform: PlatformConfig) -> bool:
         """Download video with advanced error handling"""
         try:
             ydl_opts = self.configure_ydl_options(platform)
             
-            with console.status(
-                "[bold cyan]Fetching video information...",
-                spinner="dots"
-            ):
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-            
-            # Show video info
-            self.ui.show_video_info(info)
-            console.print()
-            
-            # Confirm download
-            if not Confirm.ask(
-                "[bold yellow]⬇️  Proceed with download?[/bold yellow]",
-                default=True
-            ):
-                console.print("[yellow]⚠️  Download cancelled by user[/yellow]")
-                return False
-            
-            # Download video
-            console.print()
+            # One YoutubeDL instance serves both extraction and download
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+                # The spinner needs a live display, skip its thread when output is piped
+                if console.is_terminal:
+                    status = console.status(
+                        "[bold cyan]Fetching video information...",
+                        spinner="dots"
+                    )
+                else:
+                    status = contextlib.nullcontext()
+                
+                with status:
+                    info = ydl.extract_info(url, download=False)
+                
+                # Show video info
+                self.ui.show_video_info(info)
+                
+                # Confirm download
+                if not Confirm.ask(
+                    "[bold yellow]⬇️  Proceed with download?[/bold yellow]",
+                    default=True
+                ):
+                    console.print("[yellow]⚠️  Download cancelled by user[/yellow]", highlight=False)
+                    return False
+                
+                # Download video, reusing the already extracted info
+                console.print()
+                try:
+                    info = self._download_with_info(ydl, info)
+                finally:
+                    # The hook is shared across downloads, clear it even if this one failed
+                    self.progress_hook.reset()
+                filename = ydl.prepare_filename(info)
             
             # Success message
-            filename = ydl.prepare_filename(info)
-            self.ui.show_success_message(self.output_dir, Path(filename).name)
+            # prepare_filename already includes the output directory from outtmpl
+            self.ui.show_success_message(filename)
             
             # Add to history
-            self.download_history.append(info.get('title', 'Unknown'))
+            self.add_to_history(info.get('title', 'Unknown'))
             
             return True
             
@@ -389,25 +542,39 @@ class VideoDownloader:
             self.ui.show_error_message(str(e))
             return False
     
+    def _download_with_info(self, ydl: yt_dlp.YoutubeDL, info: dict) -> dict:
+        """Download from extracted info, re-extracting if the media URLs went stale"""
+        try:
+            return ydl.process_ie_result(info, download=True)
+        except (yt_dlp.utils.DownloadError, yt_dlp.utils.ReExtractInfo) as e:
+            # Signed CDN URLs may expire while waiting for confirmation
+            webpage_url = info.get('webpage_url')
+            if not webpage_url or not _is_expired_url_error(e):
+                raise
+            self.progress_hook.reset()
+            console.print(
+                f"[yellow]⚠️  Media links expired ({e}), fetching fresh ones...[/yellow]",
+                highlight=False
+            )
+            return ydl.extract_info(webpage_url, download=True)
+    
+    def add_to_history(self, title: str):
+        """Record a finished download"""
+        self.download_history.append(title)
+        self.download_count += 1
+    
     def show_statistics(self):
         """Show download statistics"""
         if not self.download_history:
             return
         
-        stats_table = Table(
-            title="[bold cyan]📊 Download Statistics[/bold cyan]",
-            box=box.ROUNDED,
-            border_style="cyan"
-        )
-        
-        stats_table.add_column("#", style="cyan", width=5)
-        stats_table.add_column("Video Title", style="white", width=50)
-        
-        for i, title in enumerate(self.download_history, 1):
-            stats_table.add_row(str(i), title[:47] + "..." if len(title) > 50 else title)
+        # Built only when shown, from the bounded history
+        stats_table = self._create_stats_table()
+        first = self.download_count - len(self.download_history) + 1
+        for number, title in enumerate(self.download_history, first):
+            stats_table.add_row(str(number), _truncate_title(title))
         
-        console.print()
-        console.print(stats_table)
+        console.print(Group(Text(), stats_table))
     
     def run(self):
         """Main application loop"""
@@ -415,7 +582,6 @@ class VideoDownloader:
         
         while True:
             self.ui.show_platforms_menu(self.platforms)
-            console.print()
             
             choice = Prompt.ask(
                 "[bold cyan]🎯 Select a platform[/bold cyan]",
@@ -426,24 +592,16 @@ class VideoDownloader:
             if choice == '0':
                 if self.download_history:
                     self.show_statistics()
-                console.print()
-                console.print(Panel(
-                    "[bold yellow]👋 Thank you for using Video Downloader!\n"
-                    "⭐ If you like it, star us on GitHub![/bold yellow]",
-                    border_style="yellow",
-                    box=box.DOUBLE
-                ))
-                console.print()
+                self.ui.show_goodbye_message()
                 break
             
             platform = self.platforms[choice]
             self.ui.show_platform_guide(platform)
-            console.print()
             
             url = Prompt.ask("[bold green]🔗 Enter video URL[/bold green]").strip()
             
             if not url:
-                console.print("[red]❌ URL cannot be empty![/red]")
+                console.print("[red]❌ URL cannot be empty![/red]", highlight=False)
                 continue
             
             # Validate URL
@@ -451,7 +609,8 @@ class VideoDownloader:
             if detected_platform and detected_platform.name != platform.name:
                 console.print(
                     f"[yellow]⚠️  Warning: URL appears to be from {detected_platform.name}, "
-                    f"not {platform.name}[/yellow]"
+                    f"not {platform.name}[/yellow]",
+                    highlight=False
                 )
                 if not Confirm.ask("Continue anyway?", default=False):
                     continue
@@ -466,14 +625,7 @@ class VideoDownloader:
             ):
                 if self.download_history:
                     self.show_statistics()
-                console.print()
-                console.print(Panel(
-                    "[bold yellow]👋 Thank you for using Video Downloader!\n"
-                    "⭐ If you like it, star us on GitHub![/bold yellow]",
-                    border_style="yellow",
-                    box=box.DOUBLE
-                ))
-                console.print()
+                self.ui.show_goodbye_message()
                 break
 
 
@@ -483,7 +635,7 @@ def main():
         downloader = VideoDownloader()
         downloader.run()
     except KeyboardInterrupt:
-        console.print("\n\n[yellow]⚠️  Operation cancelled by user. Goodbye![/yellow]\n")
+        console.print("\n\n[yellow]⚠️  Operation cancelled by user. Goodbye![/yellow]\n", highlight=False)
         sys.exit(0)
     except Exception as e:
         console.print(f"\n[bold red]❌ Unexpected error: {str(e)}[/bold red]\n")